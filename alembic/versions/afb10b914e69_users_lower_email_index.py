@@ -0,0 +1,28 @@
+"""Add unique index on lower(users.email)
+
+Revision ID: afb10b914e69
+Revises: 8b401fe43700
+Create Date: 2026-10-17 12:14:26.209458
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'afb10b914e69'
+down_revision: Union[str, None] = '8b401fe43700'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_users_lower_email', 'users', [sa.text('lower(email)')], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_lower_email', table_name='users')
@@ -0,0 +1,33 @@
+"""Add keyset pagination index on ai_contexts(created_at, id)
+
+Revision ID: b417b62e2a61
+Revises: afb10b914e69
+Create Date: 2026-10-17 12:21:39.314187
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b417b62e2a61'
+down_revision: Union[str, None] = 'afb10b914e69'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_ai_context_created_id',
+        'ai_contexts',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_ai_context_created_id', table_name='ai_contexts')
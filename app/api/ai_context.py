@@ -1,5 +1,5 @@
 #app/api/ai_context.py
-from fastapi import APIRouter, Depends, HTTPException, Query, status, Body
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status, Body
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
 from app.schemas.ai_context import (
@@ -74,6 +74,7 @@ def get_latest_ctx(
 
 @router.get("/", response_model=List[AIContextRead])
 def list_ai_contexts(
+    response: Response,
     object_type: Optional[str] = None,
     object_id: Optional[int] = None,
     created_by: Optional[str] = None,
@@ -81,12 +82,12 @@ def list_ai_contexts(
     created_after: Optional[str] = None,
     created_before: Optional[str] = None,
     limit: int = Query(50, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Курсор из заголовка X-Next-Cursor предыдущей страницы"),
     db: Session = Depends(get_db),
     user=Depends(get_current_active_user),
 ):
     """
-    Получить список AI-контекстов по фильтрам.
+    Получить список AI-контекстов по фильтрам (keyset-пагинация, курсор следующей страницы — в X-Next-Cursor).
     """
     filters = {}
     if object_type: filters["object_type"] = object_type
@@ -95,7 +96,10 @@ def list_ai_contexts(
     if request_id: filters["request_id"] = request_id
     if created_after: filters["created_after"] = created_after
     if created_before: filters["created_before"] = created_before
-    return get_ai_contexts(db, filters=filters, limit=limit, offset=offset)
+    items, next_cursor = get_ai_contexts(db, filters=filters, limit=limit, cursor=cursor)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return items
 
 @router.patch("/{ai_context_id}", response_model=SuccessResponse)
 def patch_ai_context(
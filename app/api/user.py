@@ -12,15 +12,16 @@ from app.crud.user import (
     get_users,
     soft_delete_user,
 )
-from app.dependencies import get_db, get_current_active_user, get_target_user_or_404_403
+from app.dependencies import DBSession, CurrentUser, get_target_user_or_404_403
 from app.schemas.response import SuccessResponse
 from app.models.user import User as DBUser
-from app.core.exceptions import ProjectValidationError
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
+# ProjectValidationError из CRUD превращается в 400 глобальным обработчиком (app/main.py).
+
 @router.get("/me", response_model=UserRead)
-def read_users_me(current_user: DBUser = Depends(get_current_active_user)):
+def read_users_me(current_user: CurrentUser):
     """
     Get current logged-in user profile.
     """
@@ -29,18 +30,12 @@ def read_users_me(current_user: DBUser = Depends(get_current_active_user)):
 @router.post("/", response_model=UserRead)
 def register_user(
     data: UserCreate,
-    db: Session = Depends(get_db),
+    db: DBSession,
 ):
     """
     Register a new user.
     """
-    try:
-        user_obj = create_user(db, data.model_dump())
-        return user_obj
-    except ProjectValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred during user registration.")
+    return create_user(db, data.model_dump())
 
 @router.get("/{user_id}", response_model=UserRead)
 async def get_user_profile(
@@ -53,11 +48,11 @@ async def get_user_profile(
 
 @router.get("/", response_model=List[UserRead])
 def list_users(
+    db: DBSession,
+    current_user: CurrentUser,
     is_active: Optional[bool] = Query(None),
     role: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
-    db: Session = Depends(get_db),
-    current_user: DBUser = Depends(get_current_active_user)
 ):
     """
     Get list of users (admin only).
@@ -77,41 +72,30 @@ def list_users(
 @router.patch("/{user_id}", response_model=UserRead)
 async def patch_user(
     data: UserUpdate,
+    db: DBSession,
     target_user: DBUser = Depends(get_target_user_or_404_403),
-    db: Session = Depends(get_db)
 ):
     """
     Update user info (self or admin).
     """
-    try:
-        user_obj = update_user(db, target_user.id, data.model_dump(exclude_unset=True))
-        return user_obj
-    except ProjectValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while updating user.")
+    return update_user(db, target_user.id, data.model_dump(exclude_unset=True))
 
 @router.delete("/{user_id}", response_model=SuccessResponse)
 async def deactivate_user(
+    db: DBSession,
     target_user: DBUser = Depends(get_target_user_or_404_403),
-    db: Session = Depends(get_db)
 ):
     """
     Soft-delete/deactivate user (self or admin).
     """
-    try:
-        soft_delete_user(db, target_user.id)
-        return SuccessResponse(result=target_user.id, detail="User deactivated")
-    except ProjectValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while deactivating user.")
+    soft_delete_user(db, target_user.id)
+    return SuccessResponse(result=target_user.id, detail="User deactivated")
 
 @router.get("/by-username/{username}", response_model=UserRead)
 def get_by_username(
     username: str,
-    db: Session = Depends(get_db),
-    current_user: DBUser = Depends(get_current_active_user)
+    db: DBSession,
+    current_user: CurrentUser,
 ):
     """
     Get user by username (admin only).
@@ -126,8 +110,8 @@ def get_by_username(
 @router.get("/by-email/{email}", response_model=UserRead)
 def get_by_email(
     email: str,
-    db: Session = Depends(get_db),
-    current_user: DBUser = Depends(get_current_active_user)
+    db: DBSession,
+    current_user: CurrentUser,
 ):
     """
     Get user by email (admin only).
@@ -1,7 +1,8 @@
 #app/core/custom_fields.py
+from dataclasses import dataclass
 from datetime import datetime
 import re
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Tuple, Union
 
 # === ВАЛИДАТОРЫ ДЛЯ СТАНДАРТНЫХ ТИПОВ ===
 
@@ -46,80 +47,110 @@ type_map: Dict[str, Callable[[Any], bool]] = {
     "dict": validate_dict,
 }
 
+# === ОПИСАНИЕ КАСТОМНОГО ПОЛЯ ===
+
+@dataclass(slots=True, frozen=True)
+class FieldSchema:
+    """
+    Неизменяемое описание custom-поля: фиксированные атрибуты вместо dict.get в горячем цикле валидации.
+    """
+    type: str
+    validator: Optional[Callable[[Any], bool]] = None
+    default: Any = None
+    choices: Tuple[Any, ...] = ()
+    required: bool = False
+    label: str = ""
+    help: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FieldSchema":
+        """Собрать FieldSchema из словаря старого формата (extend_custom_fields_schema, плагины)."""
+        return cls(
+            type=data.get("type", ""),
+            validator=data.get("validator"),
+            default=data.get("default"),
+            choices=tuple(data.get("choices", ())),
+            required=bool(data.get("required", False)),
+            label=data.get("label", ""),
+            help=data.get("help", ""),
+        )
+
+    # Совместимость со словарным доступом (schema["validator"], schema.get("type"))
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
 # === ГЛОБАЛЬНАЯ СХЕМА КАСТОМНЫХ ПОЛЕЙ ===
 
-CUSTOM_FIELDS_SCHEMA: Dict[str, Dict[str, Any]] = {
-    "story_points": {
-        "type": "int",
-        "validator": validate_story_points,
-        "default": 0,
-        "label": "Story Points",
-        "help": "Integer from 0 to 100",
-        "required": False
-    },
-    "deadline_type": {
-        "type": "choice",
-        "validator": validate_deadline_type,
-        "choices": ["hard", "soft"],
-        "default": "soft",
-        "label": "Deadline Type",
-        "help": "Type of deadline (hard/soft)",
-        "required": False
-    },
-    "external_id": {
-        "type": "str",
-        "validator": validate_external_id,
-        "default": "",
-        "label": "External ID",
-        "help": "Format: AB-12345",
-        "required": False
-    },
-    "reviewed": {
-        "type": "bool",
-        "validator": validate_reviewed,
-        "default": False,
-        "label": "Reviewed",
-        "help": "True/False",
-        "required": False
-    },
-    "deadline_ext": {
-        "type": "date",
-        "validator": validate_date,
-        "default": None,
-        "label": "Extended Deadline",
-        "help": "YYYY-MM-DD",
-        "required": False
-    },
-    "linked_files": {
-        "type": "list",
-        "validator": validate_list,
-        "default": [],
-        "label": "Linked Files",
-        "help": "List of file URLs",
-        "required": False
-    },
-    "meta_data": {
-        "type": "dict",
-        "validator": validate_dict,
-        "default": {},
-        "label": "Metadata",
-        "help": "Arbitrary key-value data",
-        "required": False
-    },
+CUSTOM_FIELDS_SCHEMA: Dict[str, FieldSchema] = {
+    "story_points": FieldSchema(
+        type="int",
+        validator=validate_story_points,
+        default=0,
+        label="Story Points",
+        help="Integer from 0 to 100",
+    ),
+    "deadline_type": FieldSchema(
+        type="choice",
+        validator=validate_deadline_type,
+        choices=("hard", "soft"),
+        default="soft",
+        label="Deadline Type",
+        help="Type of deadline (hard/soft)",
+    ),
+    "external_id": FieldSchema(
+        type="str",
+        validator=validate_external_id,
+        default="",
+        label="External ID",
+        help="Format: AB-12345",
+    ),
+    "reviewed": FieldSchema(
+        type="bool",
+        validator=validate_reviewed,
+        default=False,
+        label="Reviewed",
+        help="True/False",
+    ),
+    "deadline_ext": FieldSchema(
+        type="date",
+        validator=validate_date,
+        default=None,
+        label="Extended Deadline",
+        help="YYYY-MM-DD",
+    ),
+    "linked_files": FieldSchema(
+        type="list",
+        validator=validate_list,
+        default=[],
+        label="Linked Files",
+        help="List of file URLs",
+    ),
+    "meta_data": FieldSchema(
+        type="dict",
+        validator=validate_dict,
+        default={},
+        label="Metadata",
+        help="Arbitrary key-value data",
+    ),
 }
 
-def extend_custom_fields_schema(new_fields: Dict[str, Dict[str, Any]]) -> None:
+def extend_custom_fields_schema(new_fields: Dict[str, Union[FieldSchema, Dict[str, Any]]]) -> None:
     """
-    Добавить новые кастомные поля в схему на лету.
+    Добавить новые кастомные поля в схему на лету (принимает FieldSchema или dict).
     """
     for key, value in new_fields.items():
+        field = value if isinstance(value, FieldSchema) else FieldSchema.from_dict(value)
         # Проверка choices
-        if value.get("type") == "choice":
-            choices = value.get("choices", [])
-            default = value.get("default")
-            if default is not None and default not in choices:
-                raise ValueError(f"Default value '{default}' not in choices for field '{key}'")
-        CUSTOM_FIELDS_SCHEMA[key] = value
+        if field.type == "choice":
+            if field.default is not None and field.default not in field.choices:
+                raise ValueError(f"Default value '{field.default}' not in choices for field '{key}'")
+        CUSTOM_FIELDS_SCHEMA[key] = field
 
 def validate_custom_fields_payload(custom_fields: Dict[str, Any]) -> None:
     """
@@ -129,24 +160,24 @@ def validate_custom_fields_payload(custom_fields: Dict[str, Any]) -> None:
         schema = CUSTOM_FIELDS_SCHEMA.get(key)
         if not schema:
             raise ValueError(f"Unknown custom field: {key}")
-        if schema.get("required", False) and (value is None or value == ""):
+        if schema.required and (value is None or value == ""):
             raise ValueError(f"Custom field '{key}' is required.")
-        if schema.get("type") == "choice" and "choices" in schema:
-            if value not in schema["choices"]:
-                raise ValueError(f"Value '{value}' not allowed for field '{key}' (choices: {schema['choices']})")
+        if schema.type == "choice" and schema.choices:
+            if value not in schema.choices:
+                raise ValueError(f"Value '{value}' not allowed for field '{key}' (choices: {list(schema.choices)})")
         # Проверка по типу
-        expected_type = schema.get("type")
+        expected_type = schema.type
         type_validator = type_map.get(expected_type)
         if type_validator and not type_validator(value):
             raise ValueError(f"Value '{value}' for '{key}' must be {expected_type}")
         # Индивидуальный валидатор
-        if "validator" in schema and not schema["validator"](value):
+        if schema.validator is not None and not schema.validator(value):
             raise ValueError(f"Value '{value}' failed custom validation for '{key}'")
 
 def get_common_keys() -> List[str]:
     """Список всех поддерживаемых custom-полей."""
     return list(CUSTOM_FIELDS_SCHEMA.keys())
 
-def get_schema_for_key(key: str) -> Optional[Dict[str, Any]]:
+def get_schema_for_key(key: str) -> Optional[FieldSchema]:
     """Вернуть схему для конкретного custom-поля (или None)."""
     return CUSTOM_FIELDS_SCHEMA.get(key)
@@ -1,11 +1,14 @@
 #app/crud/ai_context.py
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm.attributes import flag_modified
 from app.models.ai_context import AIContext
 from app.core.exceptions import ProjectValidationError
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timezone
+import base64
+import json
 
 import logging
 logger = logging.getLogger("DevOS.AIContext")
@@ -71,15 +74,33 @@ def get_latest_ai_context(
         q = q.filter(AIContext.is_deleted == False)
     return q.order_by(AIContext.created_at.desc()).first()
 
+def encode_ai_context_cursor(ai_ctx: AIContext) -> str:
+    """
+    Непрозрачный курсор keyset-пагинации: (created_at, id) последней отданной строки.
+    """
+    raw = json.dumps({"c": ai_ctx.created_at.isoformat(), "i": ai_ctx.id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_ai_context_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Разобрать курсор из encode_ai_context_cursor; битый курсор — ошибка валидации.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(payload["c"]), int(payload["i"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ProjectValidationError(f"Invalid cursor: {e}")
+
 def get_ai_contexts(
     db: Session,
     filters: Optional[Dict[str, Any]] = None,
     limit: int = 50,
-    offset: int = 0,
+    cursor: Optional[str] = None,
     include_deleted: bool = False
-) -> List[AIContext]:
+) -> Tuple[List[AIContext], Optional[str]]:
     """
-    Получить список AIContext c фильтрацией и пагинацией.
+    Получить список AIContext c фильтрацией и keyset-пагинацией (от новых к старым).
+    Возвращает (строки, курсор следующей страницы или None).
     """
     filters = filters or {}
     query = db.query(AIContext)
@@ -97,7 +118,15 @@ def get_ai_contexts(
         query = query.filter(AIContext.created_at >= filters["created_after"])
     if "created_before" in filters:
         query = query.filter(AIContext.created_at <= filters["created_before"])
-    return query.order_by(AIContext.created_at.desc()).limit(limit).offset(offset).all()
+    if cursor:
+        c_at, c_id = decode_ai_context_cursor(cursor)
+        query = query.filter(tuple_(AIContext.created_at, AIContext.id) < tuple_(c_at, c_id))
+    # Берём на одну строку больше, чтобы понять, есть ли следующая страница
+    rows = query.order_by(AIContext.created_at.desc(), AIContext.id.desc()).limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, encode_ai_context_cursor(rows[-1])
+    return rows, None
 
 def update_ai_context(
     db: Session,
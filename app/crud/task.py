@@ -25,9 +25,9 @@ def validate_custom_fields_payload(custom_fields: dict):
         if not schema["validator"](value):
             raise TaskValidationError(f"Invalid value for '{key}': {value} (expected {schema['type']})")
 
-def create_task(db: Session, data: dict) -> Task:
+def build_task_values(data: dict) -> Dict[str, Any]:
     """
-    Создать новую задачу.
+    Провалидировать данные задачи и вернуть готовый набор колонок (без обращения к БД).
     """
     title = data.get("title", "").strip()
     if not title:
@@ -41,9 +41,6 @@ def create_task(db: Session, data: dict) -> Task:
     except ValueError:
         raise TaskValidationError("Project ID must be an integer.")
 
-    if db.query(Task).filter_by(project_id=project_id, title=title).first():
-        raise TaskValidationError("Task title must be unique within a project.")
-
     deadline = data.get("deadline")
     if deadline and not isinstance(deadline, date):
         try:
@@ -77,7 +74,7 @@ def create_task(db: Session, data: dict) -> Task:
     external_id = data.get("external_id")
     reviewed = data.get("reviewed", False)
 
-    task = Task(
+    return dict(
         title=title,
         description=data.get("description", "").strip(),
         task_status=data.get("task_status","todo"),
@@ -95,6 +92,16 @@ def create_task(db: Session, data: dict) -> Task:
         external_id=external_id,
         reviewed=reviewed
     )
+
+def create_task(db: Session, data: dict) -> Task:
+    """
+    Создать новую задачу.
+    """
+    values = build_task_values(data)
+    if db.query(Task).filter_by(project_id=values["project_id"], title=values["title"]).first():
+        raise TaskValidationError("Task title must be unique within a project.")
+
+    task = Task(**values)
     db.add(task)
     try:
         db.commit()
@@ -9,10 +9,11 @@ from app.core.exceptions import (
     DuplicateProjectName,
     ProjectValidationError,
     TemplateValidationError, # Добавь в core/exceptions если нет
+    TaskValidationError,
 )
 from typing import List, Optional, Dict
 from datetime import datetime, timezone
-from sqlalchemy import or_, cast, String as SQLString
+from sqlalchemy import or_, cast, insert, String as SQLString
 import logging
 
 logger = logging.getLogger("DevOS.Templates")
@@ -47,15 +48,15 @@ def create_template(db: Session, data: dict, author_id: int) -> Template:
     try:
         db.commit()
         db.refresh(template)
-        logger.info(f"Created template '{template.name}' (ID: {template.id}) by author {author_id}")
+        logger.info("Created template '%s' (ID: %s) by author %s", template.name, template.id, author_id)
         return template
     except IntegrityError as e:
         db.rollback()
-        logger.error(f"Integrity error creating template '{name}': {e}")
+        logger.error("Integrity error creating template '%s': %s", name, e)
         raise DuplicateProjectName(f"Template with name '{name}' already exists.")
     except Exception as e:
         db.rollback()
-        logger.error(f"Error creating template '{name}': {e}")
+        logger.error("Error creating template '%s': %s", name, e)
         raise ProjectValidationError("Database error while creating template.")
 
 def get_template(db: Session, template_id: int, include_deleted: bool = False) -> Template:
@@ -136,11 +137,11 @@ def update_template(db: Session, template_id: int, data: dict) -> Template:
     try:
         db.commit()
         db.refresh(template)
-        logger.info(f"Updated template '{template.name}' (ID: {template.id})")
+        logger.info("Updated template '%s' (ID: %s)", template.name, template.id)
         return template
     except Exception as e:
         db.rollback()
-        logger.error(f"Error updating template {template.id}: {e}")
+        logger.error("Error updating template %s: %s", template.id, e)
         raise ProjectValidationError("Database error while updating template.")
 
 def soft_delete_template(db: Session, template_id: int) -> Template:
@@ -149,7 +150,7 @@ def soft_delete_template(db: Session, template_id: int) -> Template:
     """
     template = get_template(db, template_id, include_deleted=True)
     if template.is_deleted:
-        logger.info(f"Template '{template.name}' (ID: {template.id}) is already soft-deleted.")
+        logger.info("Template '%s' (ID: %s) is already soft-deleted.", template.name, template.id)
         return template
 
     template.is_deleted = True
@@ -158,11 +159,11 @@ def soft_delete_template(db: Session, template_id: int) -> Template:
     try:
         db.commit()
         db.refresh(template)
-        logger.info(f"Soft-deleted template '{template.name}' (ID: {template.id})")
+        logger.info("Soft-deleted template '%s' (ID: %s)", template.name, template.id)
         return template
     except Exception as e:
         db.rollback()
-        logger.error(f"Error soft-deleting template {template.id}: {e}")
+        logger.error("Error soft-deleting template %s: %s", template.id, e)
         raise TemplateValidationError(f"Error during soft delete: {str(e)}")
 
 def restore_template(db: Session, template_id: int) -> Template:
@@ -177,11 +178,11 @@ def restore_template(db: Session, template_id: int) -> Template:
     try:
         db.commit()
         db.refresh(template)
-        logger.info(f"Restored template '{template.name}' (ID: {template.id})")
+        logger.info("Restored template '%s' (ID: %s)", template.name, template.id)
         return template
     except Exception as e:
         db.rollback()
-        logger.error(f"Error restoring template {template.id}: {e}")
+        logger.error("Error restoring template %s: %s", template.id, e)
         raise TemplateValidationError(f"Error during restore: {str(e)}")
 
 def hard_delete_template(db: Session, template_id: int) -> bool:
@@ -192,17 +193,17 @@ def hard_delete_template(db: Session, template_id: int) -> bool:
     db.delete(template)
     try:
         db.commit()
-        logger.info(f"Hard-deleted template {template_id}")
+        logger.info("Hard-deleted template %s", template_id)
         return True
     except Exception as e:
         db.rollback()
-        logger.error(f"Error hard-deleting template {template_id}: {e}")
+        logger.error("Error hard-deleting template %s: %s", template_id, e)
         raise TemplateValidationError(f"Error during hard delete: {str(e)}")
 
 from app.schemas.project import ProjectCreate
 from app.crud.project import create_project as crud_create_project
 from app.models.task import Task
-from app.crud.task import create_task as crud_create_task
+from app.crud.task import build_task_values
 
 def clone_template_to_project(
     db: Session,
@@ -222,10 +223,13 @@ def clone_template_to_project(
     new_project = crud_create_project(db=db, data=project_dict)
     db.flush()
 
+    # Задачи шаблона валидируем в памяти и вставляем одним executemany вместо commit на каждую
+    task_rows = []
+    seen_titles = set()
     if isinstance(source_template.structure, dict) and "tasks" in source_template.structure:
         for task_def in source_template.structure.get("tasks", []):
             if not isinstance(task_def, dict) or not task_def.get("title"):
-                logger.warning(f"Skipping invalid task definition in template {source_template.id}: {task_def}")
+                logger.warning("Skipping invalid task definition in template %s: %s", source_template.id, task_def)
                 continue
             task_create_data = {
                 "title": task_def["title"],
@@ -241,9 +245,15 @@ def clone_template_to_project(
                 try:
                     task_create_data["deadline"] = datetime.strptime(task_def["deadline"], "%Y-%m-%d").date()
                 except ValueError:
-                    logger.warning(f"Invalid deadline format in template task: {task_def.get('deadline')}")
-            crud_create_task(db=db, data=task_create_data)
+                    logger.warning("Invalid deadline format in template task: %s", task_def.get('deadline'))
+            row = build_task_values(task_create_data)
+            if row["title"] in seen_titles:
+                raise TaskValidationError("Task title must be unique within a project.")
+            seen_titles.add(row["title"])
+            task_rows.append(row)
+    if task_rows:
+        db.execute(insert(Task), task_rows)
     db.commit()
     db.refresh(new_project)
-    logger.info(f"Project {new_project.id} ('{new_project.name}') created from template {source_template.id}.")
+    logger.info("Project %s ('%s') created from template %s.", new_project.id, new_project.name, source_template.id)
     return new_project
@@ -1,4 +1,5 @@
 #app/crud/user.py
+from sqlalchemy import select, func
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from app.models.user import User
@@ -39,34 +40,35 @@ def create_user(db: Session, data: dict) -> User:
     try:
         db.commit()
         db.refresh(user)
-        logger.info(f"Created user {user.username}")
+        logger.info("Created user %s", user.username)
         return user
     except IntegrityError as e:
         db.rollback()
-        logger.error(f"Integrity error creating user: {e}")
+        logger.error("Integrity error creating user: %s", e)
         raise ProjectValidationError("User with this username or email already exists.")
     except Exception as e:
         db.rollback()
-        logger.error(f"DB error creating user: {e}")
+        logger.error("DB error creating user: %s", e)
         raise ProjectValidationError("Database error while creating user.")
 
 def get_user(db: Session, user_id: int) -> Optional[User]:
     """
     Получить пользователя по ID.
     """
-    return db.query(User).filter(User.id == user_id).first()
+    return db.execute(select(User).where(User.id == user_id)).scalar_one_or_none()
 
 def get_user_by_username(db: Session, username: str) -> Optional[User]:
     """
-    Получить пользователя по username.
+    Получить пользователя по username (точное совпадение, уникальный индекс ix_users_username).
     """
-    return db.query(User).filter(User.username == username).first()
+    return db.execute(select(User).where(User.username == username)).scalar_one_or_none()
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     """
-    Получить пользователя по email.
+    Получить пользователя по email (без учёта регистра, функциональный индекс ix_users_lower_email).
     """
-    return db.query(User).filter(User.email == email).first()
+    stmt = select(User).where(func.lower(User.email) == email.lower())
+    return db.execute(stmt).scalar_one_or_none()
 
 def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
     """
@@ -93,11 +95,11 @@ def update_user(db: Session, user_id: int, data: dict) -> User:
     try:
         db.commit()
         db.refresh(user)
-        logger.info(f"Updated user {user.username}")
+        logger.info("Updated user %s", user.username)
         return user
     except Exception as e:
         db.rollback()
-        logger.error(f"Error updating user: {e}")
+        logger.error("Error updating user: %s", e)
         raise ProjectValidationError("Database error while updating user.")
 
 def get_users(db: Session, filters: Dict[str, Any] = None) -> List[User]:
@@ -134,9 +136,9 @@ def soft_delete_user(db: Session, user_id: int) -> bool:
     user.is_active = False
     try:
         db.commit()
-        logger.info(f"Soft-deleted user {user.username}")
+        logger.info("Soft-deleted user %s", user.username)
         return True
     except Exception as e:
         db.rollback()
-        logger.error(f"Failed to deactivate user {user.username}: {e}")
+        logger.error("Failed to deactivate user %s: %s", user.username, e)
         raise ProjectValidationError("Database error while deactivating user.")
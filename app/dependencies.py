@@ -1,7 +1,7 @@
 # app/dependencies.py
 # app/dependencies.py
 
-from typing import Generator, AsyncGenerator
+from typing import Generator, AsyncGenerator, Annotated
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from jose import JWTError, jwt
@@ -55,6 +55,10 @@ def get_current_active_user(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user")
     return current_user
 
+# Типизированные алиасы зависимостей: `db: DBSession, user: CurrentUser` в сигнатуре роута
+DBSession = Annotated[Session, Depends(get_db)]
+CurrentUser = Annotated[User, Depends(get_current_active_user)]
+
 # Project dependencies
 from app.models.project import Project as ProjectModel
 from app.crud.project import get_project as get_project_crud
@@ -23,9 +23,14 @@ from app.api.template import router as template_router
 from app.api.user import router as user_router
 
 from app.core.settings import settings
-from app.core.exceptions import PluginNotFoundError, SpecificTemplateNotFoundError # Using SpecificTemplateNotFoundError
+from app.core.exceptions import (
+    PluginNotFoundError,
+    SpecificTemplateNotFoundError,
+    DuplicateProjectName,
+    ProjectValidationError,
+)
 from fastapi import Request 
-from fastapi.responses import JSONResponse 
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 # Логирование
 logging.basicConfig(level=logging.INFO)
@@ -43,6 +48,8 @@ app = FastAPI(
     title="DevOS Jarvis Web API",
     version="1.0.0",
     description="Production-ready modular AI project management backend",
+    # orjson сериализует большие списки (templates, users, ...) заметно быстрее stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 # Middlewares
@@ -106,7 +113,27 @@ async def specific_template_not_found_exception_handler(request: Request, exc: S
         content={"detail": exc.detail if hasattr(exc, 'detail') else str(exc)},
     )
 
-# Old TemplateNotFound handler can be removed if it's confirmed SpecificTemplateNotFoundError is used everywhere
+@app.exception_handler(DuplicateProjectName)
+async def duplicate_name_exception_handler(request: Request, exc: DuplicateProjectName):
+    return JSONResponse(
+        status_code=400,
+        content={"detail": str(exc)},
+    )
+
+@app.exception_handler(ProjectValidationError)
+async def project_validation_exception_handler(request: Request, exc: ProjectValidationError):
+    return JSONResponse(
+        status_code=400,
+        content={"detail": str(exc)},
+    )
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    logger.error("Unhandled error on %s %s: %s", request.method, request.url.path, exc, exc_info=True)
+    return JSONResponse(
+        status_code=500,
+        content={"detail": "An internal error occurred."},
+    )
 
 if __name__ == "__main__":
     import uvicorn
@@ -28,6 +28,8 @@ class AIContext(Base):
     __table_args__ = (
         # Ускоряем выборки по object_type/object_id
         Index("ix_ai_context_object", "object_type", "object_id"),
+        # Keyset-пагинация get_ai_contexts: ORDER BY created_at DESC, id DESC
+        Index("ix_ai_context_created_id", created_at.desc(), id.desc()),
         # (опционально) Ограничиваем уникальность одной пары
         # UniqueConstraint("object_type", "object_id", name="uq_ai_context_object"),
     )
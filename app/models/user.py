@@ -1,7 +1,7 @@
 #app/models/user.py
 from datetime import datetime
 from sqlalchemy import (
-    Column, Integer, String, Boolean, DateTime, JSON, func
+    Column, Integer, String, Boolean, DateTime, JSON, Index, func
 )
 from sqlalchemy.orm import relationship
 from app.models.base import Base
@@ -25,6 +25,11 @@ class User(Base):
     updated_at: datetime = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False, doc="Дата обновления")
     last_login_at: datetime = Column(DateTime(timezone=True), nullable=True, doc="Последний вход")
 
+    __table_args__ = (
+        # Регистронезависимый поиск по email (get_user_by_email) идёт по индексу
+        Index("ix_users_lower_email", func.lower(email), unique=True),
+    )
+
     # --- Связи ---
     teams = relationship("Team", backref="users", lazy="dynamic")
     settings = relationship("Setting", backref="user", lazy="dynamic")